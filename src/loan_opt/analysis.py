@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 import plotly.graph_objects as go
@@ -25,6 +25,12 @@ class LoanAnalysis:
     loan: Loan
     returns: Returns
     monthly_returns: np.ndarray | None = None
+    _growth: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _growth_source: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def generate_returns(self, n: int, seed: int | None = None):
         """Generate and store monthly returns."""
@@ -34,6 +40,28 @@ class LoanAnalysis:
             seed=seed,
         )
 
+    def growth_factors(self) -> np.ndarray:
+        """
+        Growth of a month-m contribution through the end of the term for each
+        simulation, i.e. prod_{k=m}^{term-1} (1 + r_k). Cached until
+        monthly_returns is replaced; the cached array is made read-only so it
+        can't be changed in place behind the cache.
+        """
+        if self.monthly_returns is None:
+            raise ValueError(
+                "monthly_returns not generated. Call generate_returns(n) first."
+            )
+        if self._growth is None or self._growth_source is not self.monthly_returns:
+            # accumulate in place over a reversed view so the only (n, term)
+            # allocation is the result itself
+            growth = np.add(1.0, self.monthly_returns)
+            reversed_growth = growth[:, ::-1]
+            np.cumprod(reversed_growth, axis=1, out=reversed_growth)
+            self.monthly_returns.flags.writeable = False
+            self._growth = growth
+            self._growth_source = self.monthly_returns
+        return self._growth
+
     def print_amortization(
         self,
         extra: float = 0.0,
@@ -48,33 +76,19 @@ class LoanAnalysis:
 
     def invested_balances_for_pct_principal(
         self,
-        pct_principal: float,
+        pct_principal: float | np.ndarray,
         extra: float = 0.0,
     ) -> np.ndarray:
-        """Vectorized evaluation of final invested balances for each simulation."""
-        if self.monthly_returns is None:
-            raise ValueError(
-                "monthly_returns not generated. Call generate_returns(n) first."
-            )
-
-        monthly = self.monthly_returns
-        n_sims, term = monthly.shape
-
-        balance = np.full(n_sims, self.loan.loan_amt, dtype=float)
-        invested = np.zeros(n_sims, dtype=float)
-        payment = self.loan.payment
-        monthly_rate = self.loan.rate / 12.0
-
-        for m in range(term):
-            interest = balance * monthly_rate
-            principal = payment - interest + extra * pct_principal
-            principal = np.minimum(principal, balance)
-            invest = payment + extra - principal - interest
-            r = monthly[:, m]
-            invested = (invested + invest) * (1 + r)
-            balance = balance - principal
-
-        return invested
+        """
+        Vectorized evaluation of final invested balances for each simulation.
+        An array of `pct_principal` values gives one column per value, i.e.
+        shape (n, len(pct_principal)).
+        """
+        growth = self.growth_factors()
+        invest = self.loan.monthly_investments(extra=extra, pct_principal=pct_principal)
+        # match the growth dtype so the product doesn't upcast a copy of it
+        balances = growth @ invest.astype(growth.dtype, copy=False)
+        return balances.astype(np.float64, copy=False)
 
     def stats_invested_balance_for_pct(
         self,
@@ -101,22 +115,33 @@ class LoanAnalysis:
         extra: float,
         risk_aversion: float = 0.0,
         bounds=(0.0, 1.0),
+        xatol: float = 1e-3,
     ):
         """
         Find the pct_principal that maximizes a risk-adjusted mean invested balance.
-        The objective function is mean - risk_aversion * variance / 2.
+        The objective function is mean - risk_aversion * variance / 2, and the
+        optimum is located to within `xatol` (0.1 percentage points by default).
+        The result also carries the `mean` and `var` of the final invested
+        balance at the optimum.
         """
+        evaluated = {}
 
         def objective_func(p: float) -> float:
             mean, variance = self.stats_invested_balance_for_pct(p, extra=extra)
+            evaluated[p] = mean, variance
             # 1/2 factor for variance for nicer derivatives
             return -(mean - risk_aversion * variance / 2)
 
-        return minimize_scalar(
+        result = minimize_scalar(
             fun=objective_func,
             bounds=bounds,
             method="bounded",
+            options={"xatol": xatol, "maxiter": 30},
         )
+        # the optimum is one of the evaluated points, so reuse its stats
+        # rather than rerunning the simulation
+        result.mean, result.var = evaluated[result.x]
+        return result
 
     def run_analysis(
         self,
@@ -129,7 +154,7 @@ class LoanAnalysis:
         """
         # compute objective curve for plotting (mean balance vs pct principal)
         xs = np.linspace(0.0, 1.0, 101)
-        ys = [self.mean_invested_balance_for_pct(x, extra=extra) for x in xs]
+        ys = self.invested_balances_for_pct_principal(xs, extra=extra).mean(axis=0)
 
         opt_pct_principals = []
         opt_means = []
@@ -139,16 +164,15 @@ class LoanAnalysis:
             risk_aversions = [risk_aversions]
 
         for ra in risk_aversions:
-            opt_x = self.optimize_pct_principal(extra=extra, risk_aversion=ra).x
-            mean, var = self.stats_invested_balance_for_pct(opt_x, extra=extra)
+            result = self.optimize_pct_principal(extra=extra, risk_aversion=ra)
 
-            opt_pct_principals.append(opt_x)
-            opt_means.append(mean)
-            opt_stds.append(np.sqrt(var))
+            opt_pct_principals.append(result.x)
+            opt_means.append(result.mean)
+            opt_stds.append(np.sqrt(result.var))
 
         return AnalysisResult(
             xs=xs,
-            ys=ys,
+            ys=ys.tolist(),
             opt_pct_principals=np.array(opt_pct_principals),
             opt_means=np.array(opt_means),
             opt_stds=np.array(opt_stds),
@@ -168,20 +192,20 @@ class LoanAnalysis:
             quantiles = [0.05, 0.25, 0.50, 0.75, 0.95]
 
         pcts = np.linspace(0.0, 1.0, 101)
-        results_by_pct = np.array(
-            [self.invested_balances_for_pct_principal(p, extra=extra) for p in pcts]
-        )
+        balances = self.invested_balances_for_pct_principal(pcts, extra=extra)
 
         fig = go.Figure()
 
-        for q in quantiles:
-            quantile_line = np.quantile(results_by_pct, q=q, axis=1)
+        # one call partitions each column once for every requested quantile
+        quantile_lines = np.quantile(balances, q=quantiles, axis=0)
+
+        for q, quantile_line in zip(quantiles, quantile_lines, strict=True):
             name = f"{q * 100:.0f}th Percentile"
             if q == 0.5:
                 name = "Median (50th Percentile)"
             fig.add_trace(go.Scatter(x=pcts, y=quantile_line, mode="lines", name=name))
 
-        mean_line = np.mean(results_by_pct, axis=1)
+        mean_line = np.mean(balances, axis=0)
         fig.add_trace(
             go.Scatter(
                 x=pcts,
@@ -1,6 +1,17 @@
 from dataclasses import dataclass, field
+from functools import cache
+from math import expm1, log1p
 
-from amortization.amount import calculate_amortization_amount
+import numpy as np
+from scipy.signal import lfilter
+
+
+@cache
+def _payment(loan_amt: float, rate: float, term: int) -> float:
+    """Level monthly payment that amortizes the loan, rounded to the cent."""
+    monthly_rate = rate / 12.0
+    # (1 + r)^-n written with expm1/log1p to stay accurate for small rates
+    return round(loan_amt * monthly_rate / -expm1(-term * log1p(monthly_rate)), 2)
 
 
 @dataclass
@@ -11,51 +22,82 @@ class Loan:
     payment: float = field(init=False)
 
     def __post_init__(self) -> None:
-        self.payment = calculate_amortization_amount(
-            self.loan_amt, self.rate, self.term
-        )
+        self.payment = _payment(self.loan_amt, self.rate, self.term)
+
+    def _amortize(
+        self,
+        extra: float,
+        pct_principal: float | np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Principal, interest and end-of-month balance for each month.
+
+        With P = payment + extra * pct_principal and monthly rate r, the
+        balance before payoff is L * (1 + r)^i - P * ((1 + r)^i - 1) / r, so
+        the whole schedule is evaluated at once rather than month by month.
+        An array of `pct_principal` values gives one column per value.
+        """
+        pct_principal = np.asarray(pct_principal, dtype=float)
+        scheduled = self.payment + extra * pct_principal
+        monthly_rate = self.rate / 12.0
+
+        months = np.arange(self.term + 1).reshape(-1, *(1,) * pct_principal.ndim)
+        log_growth = months * np.log1p(monthly_rate)
+        annuity = np.expm1(log_growth) / monthly_rate
+        balance = self.loan_amt * np.exp(log_growth) - scheduled * annuity
+        np.maximum(balance, 0.0, out=balance)
+
+        start = balance[:-1]
+        interest = start * monthly_rate
+        # the payoff month only pays off what is left
+        principal = np.minimum(scheduled - interest, start)
+        return principal, interest, start - principal
+
+    def monthly_investments(
+        self,
+        extra: float = 0.0,
+        pct_principal: float | np.ndarray = 1.0,
+    ) -> np.ndarray:
+        """Amount invested in each month of the term.
+
+        The loan balance does not depend on investment returns, so this
+        schedule is deterministic. An array of `pct_principal` values gives
+        one column per value, i.e. shape (term, len(pct_principal)).
+        """
+        principal, interest, _ = self._amortize(extra, pct_principal)
+        # reuse the principal buffer; it isn't returned
+        invest = np.subtract(self.payment + extra, principal, out=principal)
+        invest -= interest
+        return invest
 
     def amortization_schedule(
         self,
         extra: float = 0.0,
         inv_return: float = 0.0,
         pct_principal: float = 1.0,
-    ) -> tuple[list[dict[str, float]], float]:
+    ) -> tuple[dict[str, np.ndarray], float]:
+        """Month-by-month schedule as a mapping of column name to array."""
         if extra < 0:
             raise ValueError("Extra payment cannot be negative.")
         if not (0.0 <= pct_principal <= 1.0):
             raise ValueError("pct_principal must be between 0 and 1, inclusive.")
 
-        schedule = []
-        balance = self.loan_amt
-        interest_paid = 0.0
-        invested_balance = 0.0
-
-        for i in range(1, self.term + 1):
-            interest = balance * self.rate / 12
-            interest_paid += interest
-            principal = self.payment - interest
-            principal += extra * pct_principal
-            principal = min(principal, balance)
-            balance -= principal
-            invest = self.payment + extra - principal - interest
-            invested_balance = (invested_balance + invest) * (1 + inv_return) ** (
-                1 / 12
-            )
-
-            schedule.append(
-                {
-                    "Month": i,
-                    "Payment": principal + interest,
-                    "Principal": principal,
-                    "Interest": interest,
-                    "Balance": balance,
-                    "Invested": invest,
-                    "Invested Balance": invested_balance,
-                }
-            )
-
-        return schedule, interest_paid
+        principal, interest, balance = self._amortize(extra, pct_principal)
+        invest = self.payment + extra - principal - interest
+        # invested_balance[m] = (invested_balance[m - 1] + invest[m]) * g is a
+        # first-order IIR filter: y[m] = g * x[m] + g * y[m - 1]
+        monthly_growth = (1.0 + inv_return) ** (1.0 / 12.0)
+        invested_balance = lfilter([monthly_growth], [1.0, -monthly_growth], invest)
+
+        schedule = {
+            "Month": np.arange(1, self.term + 1),
+            "Payment": principal + interest,
+            "Principal": principal,
+            "Interest": interest,
+            "Balance": balance,
+            "Invested": invest,
+            "Invested Balance": invested_balance,
+        }
+        return schedule, interest.sum().item()
 
     def print_amortization(
         self,
@@ -66,14 +108,17 @@ class Loan:
         schedule, total_interest_paid = self.amortization_schedule(
             extra, inv_return, pct_principal
         )
-        for entry in schedule:
-            print(
-                f"Month {entry['Month']:3d}: "
-                f"Payment: {entry['Payment']:10,.2f} | "
-                f"Principal: {entry['Principal']:10,.2f} | "
-                f"Interest: {entry['Interest']:10,.2f} | "
-                f"Balance: {entry['Balance']:10,.2f} | "
-                f"Invested: {entry['Invested']:10,.2f} | "
-                f"Invested Balance: {entry['Invested Balance']:10,.2f}"
-            )
-        print(f"Total interest paid: {total_interest_paid:,.2f}")
+        row_format = (
+            "Month {:3d}: "
+            "Payment: {:10,.2f} | "
+            "Principal: {:10,.2f} | "
+            "Interest: {:10,.2f} | "
+            "Balance: {:10,.2f} | "
+            "Invested: {:10,.2f} | "
+            "Invested Balance: {:10,.2f}"
+        )
+        lines = [
+            row_format.format(*row) for row in zip(*schedule.values(), strict=True)
+        ]
+        lines.append(f"Total interest paid: {total_interest_paid:,.2f}")
+        print("\n".join(lines))
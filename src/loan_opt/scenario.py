@@ -7,22 +7,16 @@ from .loan import Loan
 
 @dataclass
 class Scenario:
+    loan: Loan
+    monthly_returns: np.ndarray
     extra: float = 0.0
     inv_return: float = 0.0
     pct_principal: float = 1.0
-    loan: Loan
-    monthly_returns: np.ndarray[float]
 
     def invested_balance(self) -> float:
-        balance = self.loan.loan_amt
-        invested_balance = 0.0
-        for _i in range(self.loan.term):
-            interest = balance * self.loan.rate / 12
-            principal = self.loan.payment - interest
-            principal += self.extra * self.pct_principal
-            principal = min(principal, balance)
-            invest = self.loan.payment + self.extra - principal - interest
-            r = self.monthly_returns[_i].item()
-            invested_balance = (invested_balance + invest) * (1 + r)
-            balance -= principal
-        return invested_balance
+        invest = self.loan.monthly_investments(
+            extra=self.extra, pct_principal=self.pct_principal
+        )
+        # growth of each month's contribution through the end of the term
+        growth = np.cumprod(1 + self.monthly_returns[::-1])[::-1]
+        return (growth @ invest).item()